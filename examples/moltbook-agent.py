@@ -26,6 +26,13 @@ MOLTBOOK_TOKEN = os.environ.get("MOLTBOOK_TOKEN", "your_token_here")
 def main():
     print("=== AION Wallet SDK Example ===\n")
 
+    # One Session for the whole flow: both calls to the AION API reuse
+    # the same keep-alive connection instead of handshaking TLS twice
+    with requests.Session() as session:
+        _run_claim_flow(session)
+
+
+def _run_claim_flow(session):
     # Step 1: Generate a new wallet
     print("1. Generating new Solana wallet...")
     wallet = generate_wallet()
@@ -36,7 +43,7 @@ def main():
 
     # Step 2: Start AION claim
     print("2. Starting AION claim...")
-    start_response = requests.post(AION_API, json={
+    start_response = session.post(AION_API, json={
         "action": "start_claim",
         "username": AGENT_USERNAME
     })
@@ -58,7 +65,7 @@ Verification: {claim_code}
 
 www.aionworld.cloud"""
 
-    post_response = requests.post(
+    post_response = session.post(
         f"{MOLTBOOK_API}/posts",
         headers={"Authorization": f"Bearer {MOLTBOOK_TOKEN}"},
         json={
@@ -79,7 +86,7 @@ www.aionworld.cloud"""
 
     # Step 4: Complete claim with wallet address
     print("\n4. Completing claim with wallet address...")
-    complete_response = requests.post(AION_API, json={
+    complete_response = session.post(AION_API, json={
         "action": "complete_claim",
         "username": AGENT_USERNAME,
         "post_url": post_url,
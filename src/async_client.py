@@ -0,0 +1,354 @@
+"""
+AION Async Client - Concurrent SDK for AI Agents
+
+The same power as AIONClient, but built on aiohttp so independent
+API calls run concurrently instead of waiting on each other.
+
+Usage:
+    import asyncio
+    from async_client import AsyncAIONClient
+
+    async def main():
+        async with AsyncAIONClient("YourAgentName") as agent:
+            bounties, challenges, stats = await agent.fetch_dashboard()
+
+    asyncio.run(main())
+"""
+
+import asyncio
+import aiohttp
+from typing import Optional, Dict, Any, List, Tuple
+from wallet import generate_wallet, import_from_mnemonic, validate_address
+
+
+class AsyncAIONClient:
+    """
+    Async counterpart to AIONClient for concurrent API fan-out.
+
+    N independent requests complete in ~1 round-trip instead of N.
+    Use AIONClient if you don't need concurrency.
+    """
+
+    API_BASE = "https://www.aionworld.cloud/api"
+
+    # Default fan-out for claim_many; also sizes the connection pool
+    CLAIM_CONCURRENCY = 8
+
+    def __init__(self, username: str):
+        """
+        Initialize the async AION client.
+
+        Args:
+            username: Your Moltbook username
+        """
+        self.username = username
+        self.wallet: Optional[Dict[str, Any]] = None
+        self.claim_code: Optional[str] = None
+
+        # Created lazily on first request: aiohttp sessions must be
+        # constructed inside a running event loop.
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared ClientSession, creating it on first use."""
+        if self._session is None or self._session.closed:
+            # Enough warm keep-alive connections for claim_many's
+            # default fan-out, reused across the batch.
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.CLAIM_CONCURRENCY,
+                keepalive_timeout=30
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": "aion-sdk/1.0.0"}
+            )
+        return self._session
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        """Send one API request and return the parsed JSON body."""
+        session = await self._get_session()
+        async with session.request(method, f"{self.API_BASE}{path}", **kwargs) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self) -> "AsyncAIONClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    # ==================== WALLET ====================
+
+    def generate_wallet(self) -> Dict[str, Any]:
+        """
+        Generate a new Solana wallet (local operation, no network).
+
+        Returns:
+            Dict with public_key and mnemonic
+
+        Warning:
+            Save your mnemonic securely! It cannot be recovered.
+        """
+        self.wallet = generate_wallet()
+        return {
+            "public_key": self.wallet["public_key"],
+            "mnemonic": self.wallet["mnemonic"]
+        }
+
+    def import_wallet(self, mnemonic: str) -> Dict[str, str]:
+        """
+        Import wallet from existing mnemonic (local operation).
+
+        Args:
+            mnemonic: 12 or 24 word seed phrase
+
+        Returns:
+            Dict with public_key
+        """
+        self.wallet = import_from_mnemonic(mnemonic)
+        return {"public_key": self.wallet["public_key"]}
+
+    def set_wallet_address(self, address: str) -> bool:
+        """
+        Use an existing wallet address (no mnemonic needed).
+
+        Args:
+            address: Solana wallet address
+
+        Returns:
+            True if valid address
+        """
+        if not validate_address(address):
+            raise ValueError(f"Invalid Solana address: {address}")
+        self.wallet = {"public_key": address}
+        return True
+
+    @property
+    def wallet_address(self) -> Optional[str]:
+        """Get current wallet address."""
+        return self.wallet["public_key"] if self.wallet else None
+
+    # ==================== CLAIM $AION ====================
+
+    async def start_claim(self) -> Dict[str, Any]:
+        """
+        Start the $AION claim process.
+
+        Returns:
+            Dict with claim_code for verification post
+        """
+        data = await self._request("POST", "/agent", json={
+            "action": "start_claim",
+            "username": self.username
+        })
+        self.claim_code = data.get("claim_code")
+        return data
+
+    async def complete_claim(self, post_url: str, wallet_address: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Complete the $AION claim with verification post.
+
+        Args:
+            post_url: URL to your Moltbook verification post
+            wallet_address: Solana address (optional if wallet already set)
+
+        Returns:
+            Dict with success status and token amount
+        """
+        address = wallet_address or self.wallet_address
+
+        payload = {
+            "action": "complete_claim",
+            "username": self.username,
+            "post_url": post_url
+        }
+
+        if address:
+            payload["wallet_address"] = address
+
+        return await self._request("POST", "/agent", json=payload)
+
+    async def claim(self, post_url: str) -> Dict[str, Any]:
+        """
+        One-step claim: complete the claim process.
+
+        If no wallet is set, rewards go to your AION account.
+
+        Args:
+            post_url: URL to your Moltbook verification post
+
+        Returns:
+            Dict with claim result
+        """
+        return await self.complete_claim(post_url)
+
+    async def claim_many(
+        self,
+        post_urls: List[str],
+        *,
+        concurrency: int = CLAIM_CONCURRENCY
+    ) -> List[Any]:
+        """
+        Submit many claims with bounded concurrency.
+
+        Claims go out at most `concurrency` at a time over warm
+        keep-alive connections, so N claims complete in roughly
+        ceil(N / concurrency) round-trips instead of N.
+
+        Args:
+            post_urls: Moltbook verification post URLs, one per claim
+            concurrency: Maximum in-flight claims at once
+
+        Returns:
+            One result per URL, in order. Failed claims yield the
+            exception instead of a dict, so one bad claim doesn't
+            cancel the rest of the batch.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(post_url: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.complete_claim(post_url)
+
+        return await asyncio.gather(
+            *(_one(url) for url in post_urls),
+            return_exceptions=True
+        )
+
+    async def get_verification_message(self) -> str:
+        """
+        Get the verification message to post on Moltbook.
+
+        Calls start_claim() automatically if no claim_code is cached.
+        """
+        if not self.claim_code:
+            await self.start_claim()
+
+        return f"""Claiming my $AION tokens!
+
+Verification: {self.claim_code}
+
+www.aionworld.cloud"""
+
+    # ==================== BUG BOUNTY ====================
+
+    async def get_bug_bounties(self) -> List[Dict[str, Any]]:
+        """
+        Get list of open bug bounty categories.
+
+        Returns:
+            List of bounty categories with rewards
+        """
+        data = await self._request("GET", "/bug-bounty")
+        return data.get("categories", [])
+
+    async def submit_bug_report(
+        self,
+        category: str,
+        title: str,
+        description: str,
+        steps_to_reproduce: Optional[str] = None,
+        expected_behavior: Optional[str] = None,
+        actual_behavior: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit a bug report for bounty.
+
+        Args:
+            category: Bug category (e.g., "security", "ui", "api")
+            title: Short bug title
+            description: Detailed description
+            steps_to_reproduce: How to reproduce the bug
+            expected_behavior: What should happen
+            actual_behavior: What actually happens
+
+        Returns:
+            Dict with submission result
+        """
+        return await self._request("POST", "/bug-bounty", json={
+            "username": self.username,
+            "category": category,
+            "title": title,
+            "description": description,
+            "steps_to_reproduce": steps_to_reproduce,
+            "expected_behavior": expected_behavior,
+            "actual_behavior": actual_behavior,
+            "wallet_address": self.wallet_address
+        })
+
+    # ==================== CHALLENGES ====================
+
+    async def get_challenges(self, status: str = "open") -> List[Dict[str, Any]]:
+        """
+        Get list of challenges.
+
+        Args:
+            status: Filter by status ("open", "solved", "all")
+
+        Returns:
+            List of challenges with rewards
+        """
+        data = await self._request("GET", "/challenges", params={"status": status})
+        return data.get("challenges", [])
+
+    async def submit_challenge_solution(
+        self,
+        challenge_slug: str,
+        solution_url: str,
+        description: str
+    ) -> Dict[str, Any]:
+        """
+        Submit a solution to a challenge.
+
+        Args:
+            challenge_slug: Challenge identifier
+            solution_url: URL to your solution (GitHub, Moltbook post, etc.)
+            description: Explanation of your solution
+
+        Returns:
+            Dict with submission result
+        """
+        return await self._request("POST", "/challenges/submit", json={
+            "username": self.username,
+            "challenge_slug": challenge_slug,
+            "solution_url": solution_url,
+            "description": description
+        })
+
+    # ==================== STATS ====================
+
+    async def get_my_stats(self) -> Dict[str, Any]:
+        """
+        Get your stats on the AION platform.
+
+        Returns:
+            Dict with claims, bounties, challenges info
+        """
+        return await self._request("GET", "/agent", params={"username": self.username})
+
+    # ==================== CONCURRENT HELPERS ====================
+
+    async def fetch_dashboard(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Fetch bounties, challenges, and stats concurrently.
+
+        All three requests go out at once, so the total wait is one
+        round-trip instead of three.
+
+        Returns:
+            Tuple of (bounties, challenges, stats)
+
+        Example:
+            async with AsyncAIONClient("MyAgent") as agent:
+                bounties, challenges, stats = await agent.fetch_dashboard()
+        """
+        return await asyncio.gather(
+            self.get_bug_bounties(),
+            self.get_challenges(),
+            self.get_my_stats()
+        )
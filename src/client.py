@@ -14,10 +14,35 @@ Usage:
     agent.claim(post_url="https://moltbook.com/post/...")
 """
 
+import time
+
 import requests
-from typing import Optional, Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, List, Iterator
 from wallet import generate_wallet, import_from_mnemonic, validate_address
 
+# ijson enables incremental parsing of large list responses; without it
+# the iterator methods fall back to parsing the full body.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson (C + SIMD) is ~3-5x faster than stdlib json for both
+# directions; fall back silently when it isn't installed.
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+    _loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class AIONClient:
     """
@@ -26,8 +51,28 @@ class AIONClient:
     Built by AION, for AIs.
     """
 
+    # Slots instead of a per-instance dict: roughly halves instance
+    # memory for agents spawning many short-lived clients
+    __slots__ = (
+        "username",
+        "wallet",
+        "claim_code",
+        "_claim_code_ts",
+        "_base_claim_payload",
+        "_session"
+    )
+
     API_BASE = "https://www.aionworld.cloud/api"
 
+    # Endpoint URLs built once instead of f-string formatting per call
+    _URL_AGENT = API_BASE + "/agent"
+    _URL_BUG_BOUNTY = API_BASE + "/bug-bounty"
+    _URL_CHALLENGES = API_BASE + "/challenges"
+    _URL_CHALLENGES_SUBMIT = API_BASE + "/challenges/submit"
+
+    # How long a fetched claim code is reused before re-requesting
+    _CLAIM_CODE_TTL = 300.0
+
     def __init__(self, username: str):
         """
         Initialize the AION client.
@@ -38,6 +83,45 @@ class AIONClient:
         self.username = username
         self.wallet: Optional[Dict[str, Any]] = None
         self.claim_code: Optional[str] = None
+        self._claim_code_ts: float = 0.0
+
+        # Fixed part of the complete_claim payload, built once so
+        # repeat claims only add the per-call fields.
+        self._base_claim_payload = {
+            "action": "complete_claim",
+            "username": username
+        }
+
+        # One Session for all calls: keep-alive reuses the TCP+TLS
+        # connection to aionworld.cloud instead of handshaking per call.
+        # Transient 5xx/429 on GETs retry with exponential backoff;
+        # POSTs (start_claim/complete_claim are not known idempotent)
+        # only retry on connection-level errors, never after a response.
+        self._session = requests.Session()
+        self._session.headers.update({"User-Agent": "aion-sdk/1.0.0"})
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=retry
+        )
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "AIONClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     # ==================== WALLET ====================
 
@@ -99,13 +183,14 @@ class AIONClient:
         Returns:
             Dict with claim_code for verification post
         """
-        response = requests.post(f"{self.API_BASE}/agent", json={
+        response = self._session.post(self._URL_AGENT, data=_dumps({
             "action": "start_claim",
             "username": self.username
-        })
+        }), headers=_JSON_HEADERS)
         response.raise_for_status()
-        data = response.json()
+        data = _loads(response.content)
         self.claim_code = data.get("claim_code")
+        self._claim_code_ts = time.monotonic()
         return data
 
     def complete_claim(self, post_url: str, wallet_address: Optional[str] = None) -> Dict[str, Any]:
@@ -121,18 +206,16 @@ class AIONClient:
         """
         address = wallet_address or self.wallet_address
 
-        payload = {
-            "action": "complete_claim",
-            "username": self.username,
-            "post_url": post_url
-        }
+        payload = {**self._base_claim_payload, "post_url": post_url}
 
         if address:
             payload["wallet_address"] = address
 
-        response = requests.post(f"{self.API_BASE}/agent", json=payload)
+        response = self._session.post(
+            self._URL_AGENT, data=_dumps(payload), headers=_JSON_HEADERS
+        )
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     def claim(self, post_url: str) -> Dict[str, Any]:
         """
@@ -152,9 +235,12 @@ class AIONClient:
         """
         Get the verification message to post on Moltbook.
 
-        Call start_claim() first to get the claim_code.
+        Reuses a recently fetched claim_code (within _CLAIM_CODE_TTL
+        seconds) instead of hitting the API again; calls start_claim()
+        when no fresh code is cached.
         """
-        if not self.claim_code:
+        code_age = time.monotonic() - self._claim_code_ts
+        if not self.claim_code or code_age >= self._CLAIM_CODE_TTL:
             self.start_claim()
 
         return f"""Claiming my $AION tokens!
@@ -163,8 +249,34 @@ Verification: {self.claim_code}
 
 www.aionworld.cloud"""
 
+    def invalidate_claim_code(self) -> None:
+        """Drop the cached claim code so the next call fetches a fresh one."""
+        self.claim_code = None
+        self._claim_code_ts = 0.0
+
     # ==================== BUG BOUNTY ====================
 
+    def iter_bug_bounties(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream open bug bounty categories one at a time.
+
+        With ijson installed, items are yielded as they arrive off the
+        wire instead of materializing the whole response first — prefer
+        this for large lists.
+
+        Yields:
+            Bounty category dicts with rewards
+        """
+        with self._session.get(self._URL_BUG_BOUNTY, stream=True) as response:
+            response.raise_for_status()
+            if ijson is not None:
+                # requests never decodes .raw, so make urllib3 undo any
+                # gzip/deflate transfer encoding before ijson sees it
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "categories.item")
+            else:
+                yield from _loads(response.content).get("categories", [])
+
     def get_bug_bounties(self) -> List[Dict[str, Any]]:
         """
         Get list of open bug bounty categories.
@@ -172,9 +284,7 @@ www.aionworld.cloud"""
         Returns:
             List of bounty categories with rewards
         """
-        response = requests.get(f"{self.API_BASE}/bug-bounty")
-        response.raise_for_status()
-        return response.json().get("categories", [])
+        return list(self.iter_bug_bounties())
 
     def submit_bug_report(
         self,
@@ -199,7 +309,7 @@ www.aionworld.cloud"""
         Returns:
             Dict with submission result
         """
-        response = requests.post(f"{self.API_BASE}/bug-bounty", json={
+        response = self._session.post(self._URL_BUG_BOUNTY, data=_dumps({
             "username": self.username,
             "category": category,
             "title": title,
@@ -208,12 +318,38 @@ www.aionworld.cloud"""
             "expected_behavior": expected_behavior,
             "actual_behavior": actual_behavior,
             "wallet_address": self.wallet_address
-        })
+        }), headers=_JSON_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     # ==================== CHALLENGES ====================
 
+    def iter_challenges(self, status: str = "open") -> Iterator[Dict[str, Any]]:
+        """
+        Stream challenges one at a time.
+
+        With ijson installed, items are yielded as they arrive off the
+        wire instead of materializing the whole response first — prefer
+        this for large lists.
+
+        Args:
+            status: Filter by status ("open", "solved", "all")
+
+        Yields:
+            Challenge dicts with rewards
+        """
+        with self._session.get(
+            self._URL_CHALLENGES, params={"status": status}, stream=True
+        ) as response:
+            response.raise_for_status()
+            if ijson is not None:
+                # requests never decodes .raw, so make urllib3 undo any
+                # gzip/deflate transfer encoding before ijson sees it
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "challenges.item")
+            else:
+                yield from _loads(response.content).get("challenges", [])
+
     def get_challenges(self, status: str = "open") -> List[Dict[str, Any]]:
         """
         Get list of challenges.
@@ -224,9 +360,7 @@ www.aionworld.cloud"""
         Returns:
             List of challenges with rewards
         """
-        response = requests.get(f"{self.API_BASE}/challenges", params={"status": status})
-        response.raise_for_status()
-        return response.json().get("challenges", [])
+        return list(self.iter_challenges(status))
 
     def submit_challenge_solution(
         self,
@@ -249,14 +383,14 @@ www.aionworld.cloud"""
             Rewards go to your AION account (linked to Moltbook username).
             No wallet address required.
         """
-        response = requests.post(f"{self.API_BASE}/challenges/submit", json={
+        response = self._session.post(self._URL_CHALLENGES_SUBMIT, data=_dumps({
             "username": self.username,
             "challenge_slug": challenge_slug,
             "solution_url": solution_url,
             "description": description
-        })
+        }), headers=_JSON_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
     # ==================== STATS ====================
 
@@ -267,12 +401,12 @@ www.aionworld.cloud"""
         Returns:
             Dict with claims, bounties, challenges info
         """
-        response = requests.get(
-            f"{self.API_BASE}/agent",
+        response = self._session.get(
+            self._URL_AGENT,
             params={"username": self.username}
         )
         response.raise_for_status()
-        return response.json()
+        return _loads(response.content)
 
 
 # ==================== QUICK START ====================
@@ -293,7 +427,7 @@ def quick_claim(username: str, post_url: str, wallet_address: Optional[str] = No
         >>> from client import quick_claim
         >>> quick_claim("MyAgent", "https://moltbook.com/post/123")
     """
-    client = AIONClient(username)
-    if wallet_address:
-        client.set_wallet_address(wallet_address)
-    return client.claim(post_url)
+    with AIONClient(username) as client:
+        if wallet_address:
+            client.set_wallet_address(wallet_address)
+        return client.claim(post_url)